@@ -1,43 +1,37 @@
 """NetOps Skills CLI - Interactive command-line interface with minimal typing."""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import click
-import questionary
-from questionary import Style
 
-from netops_skills.common.utils import (
-    get_options_for_field,
-    load_defaults,
-    load_yaml_input,
-)
-from netops_skills.skills.incident_update import (
-    generate_from_yaml as generate_incident_from_yaml,
-    generate_incident_update,
-)
-from netops_skills.skills.runbook_generator import (
-    generate_from_yaml as generate_runbook_from_yaml,
-    generate_runbook,
-    get_available_domains,
-    get_symptoms_for_domain,
-)
-from netops_skills.skills.fcr_autofill import (
-    generate_from_yaml as generate_fcr_from_yaml,
-    generate_fcr_content,
-)
+from netops_skills.common.utils import load_yaml_input
 
-# Custom style for questionary prompts
-custom_style = Style(
-    [
-        ("qmark", "fg:cyan bold"),
-        ("question", "fg:white bold"),
-        ("answer", "fg:green bold"),
-        ("pointer", "fg:cyan bold"),
-        ("highlighted", "fg:cyan bold"),
-        ("selected", "fg:green"),
-    ]
-)
+# Incident option sets shared by the Click options and the interactive prompts
+SEVERITY_CHOICES = ("P1", "P2", "P3", "P4")
+AUDIENCE_CHOICES = ("manager", "client", "internal", "executive")
+STATUS_CHOICES = ("investigating", "identified", "monitoring", "resolved", "escalated")
+
+# questionary (prompt_toolkit) and the skill modules (jinja2) are imported
+# inside the commands that need them to keep CLI start-up fast.
+
+
+@lru_cache(maxsize=None)
+def _prompt_style():
+    """Build the custom style for questionary prompts on first use."""
+    from questionary import Style
+
+    return Style(
+        [
+            ("qmark", "fg:cyan bold"),
+            ("question", "fg:white bold"),
+            ("answer", "fg:green bold"),
+            ("pointer", "fg:cyan bold"),
+            ("highlighted", "fg:cyan bold"),
+            ("selected", "fg:green"),
+        ]
+    )
 
 
 @click.group()
@@ -71,19 +65,19 @@ def main():
 )
 @click.option(
     "-a", "--audience",
-    type=click.Choice(["manager", "client", "internal", "executive"]),
+    type=click.Choice(AUDIENCE_CHOICES),
     default="manager",
     help="Target audience (default: manager)",
 )
 @click.option(
     "-s", "--severity",
-    type=click.Choice(["P1", "P2", "P3", "P4"]),
+    type=click.Choice(SEVERITY_CHOICES),
     default="P2",
     help="Incident severity (default: P2)",
 )
 @click.option(
     "--status",
-    type=click.Choice(["investigating", "identified", "monitoring", "resolved", "escalated"]),
+    type=click.Choice(STATUS_CHOICES),
     default="investigating",
     help="Current status (default: investigating)",
 )
@@ -120,6 +114,11 @@ def incident(
     DETAILED INTERACTIVE:
       netops incident -d
     """
+    from netops_skills.skills.incident_update import (
+        generate_from_yaml as generate_incident_from_yaml,
+        generate_incident_update,
+    )
+
     if input_file:
         # YAML file mode
         yaml_data = load_yaml_input(input_file)
@@ -144,11 +143,10 @@ def incident(
 
     # Output result
     if output_file:
-        Path(output_file).write_text(result)
+        Path(output_file).write_bytes(result.encode("utf-8"))
         click.echo(f"Output written to: {output_file}")
     else:
-        click.echo("\n" + "=" * 80)
-        click.echo(result)
+        sys.stdout.write("\n" + "=" * 80 + "\n" + result + "\n")
 
 
 def run_incident_interactive(detailed: bool = False) -> str:
@@ -157,11 +155,11 @@ def run_incident_interactive(detailed: bool = False) -> str:
     Args:
         detailed: If True, ask all optional questions. If False, only required + key selections.
     """
-    defaults = load_defaults()
+    import questionary
+
+    from netops_skills.skills.incident_update import generate_incident_update
 
-    click.echo("\n" + "=" * 60)
-    click.echo("INCIDENT UPDATE COMPOSER")
-    click.echo("=" * 60)
+    click.echo("\n" + "=" * 60 + "\nINCIDENT UPDATE COMPOSER\n" + "=" * 60)
     if detailed:
         click.echo("Detailed mode: all options available\n")
     else:
@@ -170,7 +168,7 @@ def run_incident_interactive(detailed: bool = False) -> str:
     # REQUIRED: incident_title (must type)
     incident_title = questionary.text(
         "Incident title:",
-        style=custom_style,
+        style=_prompt_style(),
     ).ask()
 
     if not incident_title:
@@ -180,7 +178,7 @@ def run_incident_interactive(detailed: bool = False) -> str:
     # REQUIRED: impact_summary (must type)
     impact_summary = questionary.text(
         "Impact summary:",
-        style=custom_style,
+        style=_prompt_style(),
     ).ask()
 
     if not impact_summary:
@@ -188,12 +186,11 @@ def run_incident_interactive(detailed: bool = False) -> str:
         sys.exit(1)
 
     # QUICK: severity only (most commonly changed field)
-    severity_options = get_options_for_field("incident", "severity", defaults)
     severity = questionary.select(
         "Severity:",
-        choices=severity_options,
+        choices=list(SEVERITY_CHOICES),
         default="P2",
-        style=custom_style,
+        style=_prompt_style(),
     ).ask()
 
     # Defaults for quick mode
@@ -204,49 +201,51 @@ def run_incident_interactive(detailed: bool = False) -> str:
 
     # DETAILED mode: ask additional questions
     if detailed:
-        audience_options = get_options_for_field("incident", "audience", defaults)
         audience = questionary.select(
             "Audience:",
-            choices=audience_options,
+            choices=list(AUDIENCE_CHOICES),
             default="manager",
-            style=custom_style,
+            style=_prompt_style(),
         ).ask()
 
-        status_options = get_options_for_field("incident", "current_status", defaults)
         current_status = questionary.select(
             "Current status:",
-            choices=status_options,
+            choices=list(STATUS_CHOICES),
             default="investigating",
-            style=custom_style,
+            style=_prompt_style(),
         ).ask()
 
         add_checks = questionary.confirm(
             "Add diagnostic checks done?",
             default=False,
-            style=custom_style,
+            style=_prompt_style(),
         ).ask()
 
         if add_checks:
-            click.echo("Enter checks (empty line to finish):")
-            while True:
-                check = questionary.text("  - ", style=custom_style).ask()
-                if not check:
-                    break
-                checks_done.append(check)
+            raw_checks = questionary.text(
+                "Checks done (one per line, Esc+Enter to finish):",
+                multiline=True,
+                style=_prompt_style(),
+            ).ask()
+            checks_done = [
+                line.strip() for line in (raw_checks or "").splitlines() if line.strip()
+            ]
 
         add_evidence = questionary.confirm(
             "Add evidence collected?",
             default=False,
-            style=custom_style,
+            style=_prompt_style(),
         ).ask()
 
         if add_evidence:
-            click.echo("Enter evidence items (empty line to finish):")
-            while True:
-                item = questionary.text("  - ", style=custom_style).ask()
-                if not item:
-                    break
-                evidence.append(item)
+            raw_evidence = questionary.text(
+                "Evidence items (one per line, Esc+Enter to finish):",
+                multiline=True,
+                style=_prompt_style(),
+            ).ask()
+            evidence = [
+                line.strip() for line in (raw_evidence or "").splitlines() if line.strip()
+            ]
 
     # Generate output
     return generate_incident_update(
@@ -320,6 +319,11 @@ def runbook(
     INTERACTIVE:
       netops runbook
     """
+    from netops_skills.skills.runbook_generator import (
+        generate_from_yaml as generate_runbook_from_yaml,
+        generate_runbook,
+    )
+
     if input_file:
         # YAML file mode
         yaml_data = load_yaml_input(input_file)
@@ -343,18 +347,23 @@ def runbook(
 
     # Output result
     if output_file:
-        Path(output_file).write_text(result)
+        Path(output_file).write_bytes(result.encode("utf-8"))
         click.echo(f"Output written to: {output_file}")
     else:
-        click.echo("\n" + "=" * 80)
-        click.echo(result)
+        sys.stdout.write("\n" + "=" * 80 + "\n" + result + "\n")
 
 
 def run_runbook_interactive() -> str:
     """Run interactive runbook generator."""
-    click.echo("\n" + "=" * 60)
-    click.echo("SAFE TROUBLESHOOTING RUNBOOK GENERATOR")
-    click.echo("=" * 60)
+    import questionary
+
+    from netops_skills.skills.runbook_generator import (
+        generate_runbook,
+        get_available_domains,
+        get_symptoms_for_domain,
+    )
+
+    click.echo("\n" + "=" * 60 + "\nSAFE TROUBLESHOOTING RUNBOOK GENERATOR\n" + "=" * 60)
     click.echo("Required: 2 selections | All steps are SAFE by default\n")
 
     # Get available domains
@@ -366,8 +375,8 @@ def run_runbook_interactive() -> str:
     # REQUIRED: domain selection
     domain = questionary.select(
         "Domain:",
-        choices=domains,
-        style=custom_style,
+        choices=list(domains),
+        style=_prompt_style(),
     ).ask()
 
     if not domain:
@@ -383,8 +392,8 @@ def run_runbook_interactive() -> str:
     # REQUIRED: symptom selection
     symptom = questionary.select(
         "Symptom category:",
-        choices=symptoms,
-        style=custom_style,
+        choices=list(symptoms),
+        style=_prompt_style(),
     ).ask()
 
     if not symptom:
@@ -458,6 +467,11 @@ def fcr(
     YAML MODE:
       netops fcr -i examples/fcr_firewall.yaml
     """
+    from netops_skills.skills.fcr_autofill import (
+        generate_from_yaml as generate_fcr_from_yaml,
+        generate_fcr_content,
+    )
+
     if input_file:
         yaml_data = load_yaml_input(input_file)
         result = generate_fcr_from_yaml(yaml_data)
@@ -470,12 +484,12 @@ def fcr(
         )
     else:
         # Interactive - just ask purpose
-        click.echo("\n" + "=" * 60)
-        click.echo("FCR SECTION AUTOFILL")
-        click.echo("=" * 60)
+        click.echo("\n" + "=" * 60 + "\nFCR SECTION AUTOFILL\n" + "=" * 60)
         click.echo("Required: 1 field | Everything else defaults\n")
 
-        purpose = questionary.text("Purpose:", style=custom_style).ask()
+        import questionary
+
+        purpose = questionary.text("Purpose:", style=_prompt_style()).ask()
         if not purpose:
             click.echo("Error: purpose is required", err=True)
             sys.exit(1)
@@ -483,11 +497,10 @@ def fcr(
         result = generate_fcr_content(purpose=purpose)
 
     if output_file:
-        Path(output_file).write_text(result)
+        Path(output_file).write_bytes(result.encode("utf-8"))
         click.echo(f"Output written to: {output_file}")
     else:
-        click.echo("\n" + "=" * 80)
-        click.echo(result)
+        sys.stdout.write("\n" + "=" * 80 + "\n" + result + "\n")
 
 
 if __name__ == "__main__":
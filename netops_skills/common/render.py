@@ -1,22 +1,113 @@
 """Template rendering utilities for NetOps Skills."""
 
+import os
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    select_autoescape,
+)
 
 
-def get_template_env() -> Environment:
-    """Get Jinja2 environment configured for templates directory."""
-    templates_dir = Path(__file__).parent.parent.parent / "templates"
+# Resolved once at import; the package does not move while running
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+_TEMPLATES_DIR = _PACKAGE_DIR.parent / "templates"
+_COMPILED_TEMPLATES_DIR = _PACKAGE_DIR / "_compiled_templates"
+
+
+def get_templates_dir() -> Path:
+    """Get the templates directory path."""
+    return _TEMPLATES_DIR
+
+
+def get_compiled_templates_dir() -> Path:
+    """Get the directory holding ahead-of-time compiled templates."""
+    return _COMPILED_TEMPLATES_DIR
+
+
+def get_bytecode_cache() -> BytecodeCache | None:
+    """Get an on-disk bytecode cache so compiled templates survive restarts.
+
+    Returns:
+        Bytecode cache under the user cache directory, or None if the
+        directory cannot be created (e.g. read-only home)
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    cache_dir = Path(cache_home) / "netops_skills" / "jinja"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+def _create_env(loader: BaseLoader) -> Environment:
+    """Create a Jinja2 environment with the settings all templates expect."""
     return Environment(
-        loader=FileSystemLoader(templates_dir),
+        loader=loader,
         autoescape=select_autoescape(default=False),
         trim_blocks=True,
         lstrip_blocks=True,
+        # Templates do not change while the CLI runs; skip per-lookup mtime checks
+        auto_reload=False,
+        bytecode_cache=get_bytecode_cache(),
     )
 
 
+def _compiled_templates_current() -> bool:
+    """Check that every template has a compiled module at least as new as itself."""
+    sources = list(get_templates_dir().glob("*.md"))
+    if not sources:
+        return False
+    compiled_dir = get_compiled_templates_dir()
+    for source in sources:
+        module = compiled_dir / ModuleLoader.get_module_filename(source.name)
+        try:
+            if module.stat().st_mtime < source.stat().st_mtime:
+                return False
+        except FileNotFoundError:
+            return False
+    return True
+
+
+def compile_templates(target: Path | None = None) -> Path:
+    """Compile all templates into Python modules for ModuleLoader.
+
+    Args:
+        target: Output directory (default: get_compiled_templates_dir())
+
+    Returns:
+        Directory the compiled templates were written to
+    """
+    target = target or get_compiled_templates_dir()
+    env = _create_env(FileSystemLoader(get_templates_dir()))
+    env.compile_templates(str(target), zip=None)
+    get_template_env.cache_clear()
+    return target
+
+
+@lru_cache(maxsize=1)
+def get_template_env() -> Environment:
+    """Get Jinja2 environment configured for templates directory.
+
+    The environment is created once per process so its template cache is
+    reused across renders. Ahead-of-time compiled templates (see
+    compile_templates) are used when present and up to date, otherwise
+    templates are parsed from source.
+    """
+    if _compiled_templates_current():
+        return _create_env(ModuleLoader(get_compiled_templates_dir()))
+    return _create_env(FileSystemLoader(get_templates_dir()))
+
+
 def render_template(template_name: str, context: dict[str, Any]) -> str:
     """Render a template with the given context.
 
@@ -32,11 +123,11 @@ def render_template(template_name: str, context: dict[str, Any]) -> str:
     return template.render(**context)
 
 
-def format_bullet_list(items: list[str], indent: int = 0) -> str:
+def format_bullet_list(items: Sequence[str], indent: int = 0) -> str:
     """Format a list of items as markdown bullets.
 
     Args:
-        items: List of strings to format
+        items: List or tuple of strings to format
         indent: Number of spaces to indent
 
     Returns:
@@ -44,15 +135,16 @@ def format_bullet_list(items: list[str], indent: int = 0) -> str:
     """
     if not items:
         return ""
-    prefix = " " * indent
-    return "\n".join(f"{prefix}- {item}" for item in items)
+    # str.join materializes its argument anyway, so a list is the fast path
+    marker = f"{' ' * indent}- " if indent else "- "
+    return "\n".join([f"{marker}{item}" for item in items])
 
 
-def format_numbered_list(items: list[str], start: int = 1) -> str:
+def format_numbered_list(items: Sequence[str], start: int = 1) -> str:
     """Format a list of items as numbered list.
 
     Args:
-        items: List of strings to format
+        items: List or tuple of strings to format
         start: Starting number
 
     Returns:
@@ -60,7 +152,7 @@ def format_numbered_list(items: list[str], start: int = 1) -> str:
     """
     if not items:
         return ""
-    return "\n".join(f"{i}. {item}" for i, item in enumerate(items, start=start))
+    return "\n".join([f"{i}. {item}" for i, item in enumerate(items, start=start)])
 
 
 def format_section_header(title: str, level: int = 2) -> str:
@@ -1,10 +1,10 @@
 """Input validation schemas for NetOps Skills."""
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Literal, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IncidentInput:
     """Schema for incident update input."""
 
@@ -22,17 +22,29 @@ class IncidentInput:
     checks_done: list[str] = field(default_factory=list)
     evidence: list[str] = field(default_factory=list)
 
+    _REQUIRED = (
+        ("incident_title", "incident_title is required"),
+        ("impact_summary", "impact_summary is required"),
+    )
+
     def validate(self) -> list[str]:
         """Validate required fields. Returns list of errors."""
-        errors = []
-        if not self.incident_title or not self.incident_title.strip():
-            errors.append("incident_title is required")
-        if not self.impact_summary or not self.impact_summary.strip():
-            errors.append("impact_summary is required")
-        return errors
+        return [
+            message
+            for name, message in self._REQUIRED
+            if not (getattr(self, name) or "").strip()
+        ]
+
+
+AccessMode = Literal["gui_only", "cli_read_only", "cli_full"]
+RunbookEnvironment = Literal["prod", "uat", "dev", "lab"]
+
+# Access modes understood by filter_steps_by_access_mode
+ACCESS_MODES = ("gui_only", "cli_read_only", "cli_full")
+_VALID_ACCESS_MODES = frozenset(ACCESS_MODES)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RunbookInput:
     """Schema for runbook generator input."""
 
@@ -41,20 +53,27 @@ class RunbookInput:
     symptom_category: str
 
     # SELECTABLE with defaults
-    access_mode: str = "gui_only"
-    environment: str = "prod"
+    access_mode: AccessMode = "gui_only"
+    environment: RunbookEnvironment = "prod"
+
+    _REQUIRED = (
+        ("domain", "domain is required"),
+        ("symptom_category", "symptom_category is required"),
+    )
 
     def validate(self) -> list[str]:
-        """Validate required fields. Returns list of errors."""
-        errors = []
-        if not self.domain or not self.domain.strip():
-            errors.append("domain is required")
-        if not self.symptom_category or not self.symptom_category.strip():
-            errors.append("symptom_category is required")
+        """Validate required fields and access mode. Returns list of errors."""
+        errors = [
+            message
+            for name, message in self._REQUIRED
+            if not (getattr(self, name) or "").strip()
+        ]
+        if self.access_mode not in _VALID_ACCESS_MODES:
+            errors.append(f"access_mode must be one of: {', '.join(ACCESS_MODES)}")
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class FCRInput:
     """Schema for FCR autofill input."""
 
@@ -68,9 +87,14 @@ class FCRInput:
     risk_level: str = "low"
     environment: str = "prod"
 
+    _REQUIRED = (
+        ("purpose", "purpose is required"),
+    )
+
     def validate(self) -> list[str]:
         """Validate required fields. Returns list of errors."""
-        errors = []
-        if not self.purpose or not self.purpose.strip():
-            errors.append("purpose is required")
-        return errors
+        return [
+            message
+            for name, message in self._REQUIRED
+            if not (getattr(self, name) or "").strip()
+        ]
@@ -1,29 +1,114 @@
 """Shared utilities for NetOps Skills."""
 
+import json
+import os
+import time
+from collections.abc import Callable
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
+try:
+    # Optional "fast" extra: orjson decodes the precompiled JSON config faster
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+def _parse_yaml(stream: Any) -> Any:
+    """Parse YAML with the libyaml-backed loader when available.
+
+    PyYAML is imported here rather than at module level so runs that only
+    read precompiled JSON config never pay for the import.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+_CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
 
 
 def get_config_dir() -> Path:
     """Get the config directory path."""
-    return Path(__file__).parent.parent / "config"
+    return _CONFIG_DIR
 
 
+def _write_json_cache(json_path: Path, data: Any, source_mtime_ns: int) -> None:
+    """Atomically write a JSON copy of parsed config, stamped with its source mtime.
+
+    Best effort: skipped when the install directory is unwritable or the data
+    does not survive a JSON round trip unchanged (non-string keys, dates, ...).
+    """
+    try:
+        # allow_nan=False: NaN/Infinity are not JSON and orjson rejects them
+        text = json.dumps(data, ensure_ascii=False, allow_nan=False)
+        if json.loads(text) != data:
+            return
+    except (TypeError, ValueError):
+        return
+    tmp_path = json_path.with_name(f".{json_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.utime(tmp_path, ns=(source_mtime_ns, source_mtime_ns))
+        os.replace(tmp_path, json_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_config_file(yaml_path: Path) -> Any:
+    """Load a bundled YAML config file, preferring a precompiled JSON copy.
+
+    A ``.json`` sibling of the YAML file is used only while its mtime matches
+    the YAML source's exactly (it is stamped with it when written). It is
+    written automatically after each YAML parse whose result JSON represents
+    faithfully (scripts/compile_configs.py can also pre-build it).
+
+    Args:
+        yaml_path: Path to the YAML source file
+
+    Returns:
+        Parsed file contents
+    """
+    json_path = yaml_path.with_suffix(".json")
+    yaml_mtime_ns = yaml_path.stat().st_mtime_ns
+    try:
+        if json_path.stat().st_mtime_ns == yaml_mtime_ns:
+            return _json_loads(json_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except ValueError:
+        # Corrupt or truncated copy (both json and orjson decode errors are
+        # ValueErrors): treat as a cache miss and rebuild it from the YAML
+        pass
+    # The file object is handed to the parser, which pulls it in small chunks,
+    # so even large playbooks are never read into one bytes object up front
+    with open(yaml_path, "rb") as f:
+        data = _parse_yaml(f)
+    _write_json_cache(json_path, data, yaml_mtime_ns)
+    return data
+
+
+@lru_cache(maxsize=1)
 def load_defaults() -> dict[str, Any]:
-    """Load defaults from defaults.yaml."""
-    defaults_path = get_config_dir() / "defaults.yaml"
-    with open(defaults_path) as f:
-        return yaml.safe_load(f)
+    """Load defaults from defaults.yaml.
+
+    The parsed result is cached for the lifetime of the process and shared
+    between callers, so it must be treated as read-only.
+    """
+    return load_config_file(get_config_dir() / "defaults.yaml")
 
 
+@lru_cache(maxsize=1)
 def load_profiles() -> dict[str, Any]:
-    """Load profiles from profiles.yaml."""
-    profiles_path = get_config_dir() / "profiles.yaml"
-    with open(profiles_path) as f:
-        return yaml.safe_load(f)
+    """Load profiles from profiles.yaml.
+
+    Cached and shared like load_defaults(); treat the result as read-only.
+    """
+    return load_config_file(get_config_dir() / "profiles.yaml")
 
 
 def load_yaml_input(file_path: str | Path) -> dict[str, Any]:
@@ -35,8 +120,8 @@ def load_yaml_input(file_path: str | Path) -> dict[str, Any]:
     Returns:
         Dictionary of input values
     """
-    with open(file_path) as f:
-        return yaml.safe_load(f) or {}
+    with open(file_path, "rb") as f:
+        return _parse_yaml(f) or {}
 
 
 def merge_with_defaults(
@@ -51,16 +136,24 @@ def merge_with_defaults(
     Returns:
         Merged dictionary
     """
-    result = defaults.copy()
-    for key, value in user_input.items():
-        if value is not None and value != "":
-            result[key] = value
-    return result
+    provided = {
+        key: value
+        for key, value in user_input.items()
+        if value is not None and value != ""
+    }
+    return defaults | provided
 
 
 def get_current_timestamp() -> str:
-    """Get current timestamp in standard format."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    """Get current timestamp in standard format (YYYY-MM-DD HH:MM UTC)."""
+    return _format_minute_timestamp(int(time.time()) // 60)
+
+
+@lru_cache(maxsize=1)
+def _format_minute_timestamp(epoch_minute: int) -> str:
+    """Format a UTC timestamp; cached so it is built once per wall-clock minute."""
+    now = datetime.fromtimestamp(epoch_minute * 60, timezone.utc)
+    return f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d} UTC"
 
 
 def get_options_for_field(
@@ -71,7 +164,7 @@ def get_options_for_field(
     Args:
         skill: Skill name ('incident', 'runbook', 'fcr')
         field_name: Name of the field
-        defaults: Pre-loaded defaults (optional)
+        defaults: Pre-loaded defaults (optional, cached defaults used if omitted)
 
     Returns:
         List of options for the field
@@ -92,7 +185,7 @@ def get_default_value(
     Args:
         skill: Skill name ('incident', 'runbook', 'fcr')
         field_name: Name of the field
-        defaults: Pre-loaded defaults (optional)
+        defaults: Pre-loaded defaults (optional, cached defaults used if omitted)
 
     Returns:
         Default value for the field
@@ -102,3 +195,30 @@ def get_default_value(
 
     skill_defaults = defaults.get(skill, {})
     return skill_defaults.get(field_name)
+
+
+def run_batch(
+    generate: Callable[[Any], str],
+    items: list[Any],
+    initializer: Callable[[], None] | None = None,
+    max_workers: int | None = None,
+) -> list[str]:
+    """Apply a skill's per-item generator to many inputs across worker processes.
+
+    Args:
+        generate: Picklable per-item function (e.g. a partial of generate_from_yaml)
+        items: Inputs to pass to generate
+        initializer: Run once in each worker process to warm its caches
+        max_workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Outputs in the same order as items
+    """
+    if len(items) < 2:
+        # Not worth the process start-up cost
+        return [generate(item) for item in items]
+    # Imported here: concurrent.futures.process pulls in multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=initializer) as pool:
+        return list(pool.map(generate, items))
@@ -7,11 +7,15 @@ Does NOT replace the official Word FCR form - generates CONTENT only.
 from dataclasses import dataclass
 from typing import Any
 
-from netops_skills.common.render import render_template
-from netops_skills.common.utils import get_current_timestamp, load_defaults
+from netops_skills.common.render import (
+    format_bullet_list,
+    format_numbered_list,
+    render_template,
+)
+from netops_skills.common.utils import get_current_timestamp
 
 
-@dataclass
+@dataclass(slots=True)
 class FCRInput:
     """Schema for FCR autofill input."""
     purpose: str
@@ -21,21 +25,38 @@ class FCRInput:
     risk_level: str = "low"
     environment: str = "prod"
 
+    _REQUIRED = (
+        ("purpose", "purpose is required"),
+    )
+
     def validate(self) -> list[str]:
-        errors = []
-        if not self.purpose or not self.purpose.strip():
-            errors.append("purpose is required")
-        return errors
+        return [
+            message
+            for name, message in self._REQUIRED
+            if not (getattr(self, name) or "").strip()
+        ]
 
 
 # Content generators based on change_type
 TECHNICAL_DESCRIPTIONS = {
-    "firewall_rule": "Add firewall rule to {direction} traffic for {purpose}. Rule count: {rule_count}.",
-    "nat_change": "Configure NAT translation for {purpose}. Direction: {direction}.",
-    "f5_ssl": "Update F5 SSL profile/certificate for {purpose}.",
-    "routing_change": "Modify routing configuration for {purpose}. Direction: {direction}.",
-    "acl_update": "Update access control list for {purpose}. Direction: {direction}.",
-    "vpn_config": "Configure VPN settings for {purpose}.",
+    "firewall_rule": lambda purpose, direction, rule_count: (
+        f"Add firewall rule to {direction} traffic for {purpose}. Rule count: {rule_count}."
+    ),
+    "nat_change": lambda purpose, direction, rule_count: (
+        f"Configure NAT translation for {purpose}. Direction: {direction}."
+    ),
+    "f5_ssl": lambda purpose, direction, rule_count: (
+        f"Update F5 SSL profile/certificate for {purpose}."
+    ),
+    "routing_change": lambda purpose, direction, rule_count: (
+        f"Modify routing configuration for {purpose}. Direction: {direction}."
+    ),
+    "acl_update": lambda purpose, direction, rule_count: (
+        f"Update access control list for {purpose}. Direction: {direction}."
+    ),
+    "vpn_config": lambda purpose, direction, rule_count: (
+        f"Configure VPN settings for {purpose}."
+    ),
 }
 
 TESTS_BY_TYPE = {
@@ -128,6 +149,12 @@ EVIDENCE_CHECKLIST = [
     "Test results documentation",
 ]
 
+# Static lists rendered to markdown once at import time
+_TESTS_MD = {k: format_numbered_list(v) for k, v in TESTS_BY_TYPE.items()}
+_ROLLBACK_MD = {k: format_numbered_list(v) for k, v in ROLLBACK_BY_TYPE.items()}
+_CHECKLIST_MD = format_bullet_list([f"[x] {item}" for item in CHECKLIST_ITEMS])
+_EVIDENCE_MD = format_bullet_list([f"[ ] {item}" for item in EVIDENCE_CHECKLIST])
+
 
 def generate_fcr_content(
     purpose: str,
@@ -138,22 +165,13 @@ def generate_fcr_content(
     environment: str = "prod",
 ) -> str:
     """Generate FCR section content."""
-    input_data = FCRInput(
-        purpose=purpose,
-        change_type=change_type,
-        rule_count=rule_count,
-        direction=direction,
-        risk_level=risk_level,
-        environment=environment,
-    )
-
-    errors = input_data.validate()
-    if errors:
-        raise ValueError(f"Invalid input: {', '.join(errors)}")
+    # Inline precondition check; FCRInput.validate() remains for external callers
+    if not purpose or not purpose.strip():
+        raise ValueError("Invalid input: purpose is required")
 
     # Build technical description
-    tech_template = TECHNICAL_DESCRIPTIONS.get(change_type, TECHNICAL_DESCRIPTIONS["firewall_rule"])
-    technical_description = tech_template.format(
+    describe = TECHNICAL_DESCRIPTIONS.get(change_type, TECHNICAL_DESCRIPTIONS["firewall_rule"])
+    technical_description = describe(
         purpose=purpose, direction=direction, rule_count=rule_count
     )
 
@@ -165,26 +183,31 @@ def generate_fcr_content(
         "risk_level": risk_level,
         "environment": environment,
         "technical_description": technical_description,
-        "tests_conducted": TESTS_BY_TYPE.get(change_type, TESTS_BY_TYPE["firewall_rule"]),
-        "rollback_options": ROLLBACK_BY_TYPE.get(change_type, ROLLBACK_BY_TYPE["firewall_rule"]),
+        "tests_conducted_md": _TESTS_MD.get(change_type, _TESTS_MD["firewall_rule"]),
+        "rollback_options_md": _ROLLBACK_MD.get(change_type, _ROLLBACK_MD["firewall_rule"]),
         "rollback_time": ROLLBACK_TIME.get(risk_level, "< 5 minutes"),
         "impact_statement": IMPACT_BY_RISK.get(risk_level, IMPACT_BY_RISK["low"]),
         "affected_systems": [f"{environment.upper()} {change_type.replace('_', ' ').title()} infrastructure"],
-        "checklist_justification": CHECKLIST_ITEMS,
-        "evidence_checklist": EVIDENCE_CHECKLIST,
+        "checklist_justification_md": _CHECKLIST_MD,
+        "evidence_checklist_md": _EVIDENCE_MD,
         "timestamp": get_current_timestamp(),
     }
 
     return render_template("fcr_sections.md", context)
 
 
+# YAML input keys and their defaults, in generate_fcr_content order
+_YAML_FIELDS = (
+    ("purpose", ""),
+    ("change_type", "firewall_rule"),
+    ("rule_count", "single"),
+    ("direction", "inbound"),
+    ("risk_level", "low"),
+    ("environment", "prod"),
+)
+
+
 def generate_from_yaml(yaml_data: dict[str, Any]) -> str:
     """Generate FCR content from YAML input."""
-    return generate_fcr_content(
-        purpose=yaml_data.get("purpose", ""),
-        change_type=yaml_data.get("change_type", "firewall_rule"),
-        rule_count=yaml_data.get("rule_count", "single"),
-        direction=yaml_data.get("direction", "inbound"),
-        risk_level=yaml_data.get("risk_level", "low"),
-        environment=yaml_data.get("environment", "prod"),
-    )
+    kwargs = {name: yaml_data.get(name, default) for name, default in _YAML_FIELDS}
+    return generate_fcr_content(**kwargs)
@@ -7,133 +7,206 @@ This skill reduces the time spent drafting incident communications by:
 - Creating audience-specific formatting (manager vs client)
 """
 
-from dataclasses import asdict
-from typing import Any
+import sys
+from collections.abc import Sequence
+from dataclasses import fields
+from functools import lru_cache, partial
+from typing import Any, NamedTuple
 
-from netops_skills.common.render import (
-    format_bullet_list,
-    format_numbered_list,
-    render_template,
-)
+from netops_skills.common.render import get_template_env, render_template
 from netops_skills.common.schema import IncidentInput
-from netops_skills.common.utils import (
-    get_current_timestamp,
-    load_defaults,
-    merge_with_defaults,
+from netops_skills.common.utils import get_current_timestamp, load_defaults, run_batch
+
+
+_join_lines = "\n".join
+
+# Audiences with their own template (incident_update_<audience>.md)
+AUDIENCES = ("manager", "client")
+
+# Separator between the audience sections of incident_update_combined.md
+_AUDIENCE_SPLIT = "<!--SPLIT-->"
+
+# Fallbacks when defaults.yaml lacks an entry; shared immutable tuples
+_DEFAULT_NEXT_STEPS = ("Continue investigation",)
+_DEFAULT_EVIDENCE_CHECKLIST = (
+    "Screenshots of error messages/alerts",
+    "Relevant log entries with timestamps",
+    "Timeline of events",
 )
 
 
-def get_next_steps(status: str, defaults: dict[str, Any]) -> list[str]:
+class _IncidentTables(NamedTuple):
+    """Incident lookup tables flattened out of defaults.yaml."""
+
+    field_defaults: dict[str, str]
+    next_steps: dict[str, Sequence[str]]
+    next_update_time: dict[str, str]
+    evidence_checklist: Sequence[str] | None
+
+
+@lru_cache(maxsize=1)
+def _incident_tables() -> _IncidentTables:
+    """Flatten the incident lookup tables out of the cached defaults once.
+
+    Values are looked up with the same defaults as the explicit
+    incident_defaults path of the get_* helpers, so both return the same.
+    """
+    incident_defaults = load_defaults().get("incident", {})
+    return _IncidentTables(
+        field_defaults={
+            "audience": incident_defaults["audience"],
+            "severity": incident_defaults["severity"],
+            "current_status": incident_defaults["current_status"],
+        },
+        # Interned keys match the CLI's literal choice strings by identity
+        next_steps={
+            sys.intern(status): steps
+            for status, steps in incident_defaults.get("next_steps", {}).items()
+        },
+        next_update_time={
+            sys.intern(severity): interval
+            for severity, interval in incident_defaults.get("next_update_time", {}).items()
+        },
+        evidence_checklist=incident_defaults.get(
+            "evidence_checklist", _DEFAULT_EVIDENCE_CHECKLIST
+        ),
+    )
+
+
+def get_next_steps(
+    status: str, *, incident_defaults: dict[str, Any] | None = None
+) -> Sequence[str]:
     """Get auto-generated next steps based on current status.
 
     Args:
         status: Current incident status
-        defaults: Loaded defaults configuration
+        incident_defaults: The "incident" section of the loaded defaults
+            (optional, cached tables used if omitted)
 
     Returns:
-        List of next step strings
+        Sequence of next step strings
     """
-    incident_defaults = defaults.get("incident", {})
-    next_steps_map = incident_defaults.get("next_steps", {})
-    return next_steps_map.get(status, ["Continue investigation"])
+    if incident_defaults is None:
+        next_steps_map = _incident_tables().next_steps
+    else:
+        next_steps_map = incident_defaults.get("next_steps", {})
+    return next_steps_map.get(status, _DEFAULT_NEXT_STEPS)
 
 
-def get_next_update_time(severity: str, defaults: dict[str, Any]) -> str:
+def get_next_update_time(
+    severity: str, *, incident_defaults: dict[str, Any] | None = None
+) -> str:
     """Get default next update time based on severity.
 
     Args:
         severity: Incident severity (P1-P4)
-        defaults: Loaded defaults configuration
+        incident_defaults: The "incident" section of the loaded defaults
+            (optional, cached tables used if omitted)
 
     Returns:
         Next update time string
     """
-    incident_defaults = defaults.get("incident", {})
-    time_map = incident_defaults.get("next_update_time", {})
+    if incident_defaults is None:
+        time_map = _incident_tables().next_update_time
+    else:
+        time_map = incident_defaults.get("next_update_time", {})
     return time_map.get(severity, "1 hour")
 
 
-def get_evidence_checklist(has_evidence: bool, defaults: dict[str, Any]) -> list[str]:
+def get_evidence_checklist(
+    has_evidence: bool, *, incident_defaults: dict[str, Any] | None = None
+) -> Sequence[str]:
     """Get evidence checklist when no evidence provided.
 
     Args:
         has_evidence: Whether evidence was provided
-        defaults: Loaded defaults configuration
+        incident_defaults: The "incident" section of the loaded defaults
+            (optional, cached tables used if omitted)
 
     Returns:
-        List of evidence items to collect
+        Sequence of evidence items to collect (empty tuple if evidence provided)
     """
     if has_evidence:
-        return []
-    incident_defaults = defaults.get("incident", {})
-    return incident_defaults.get("evidence_checklist", [
-        "Screenshots of error messages/alerts",
-        "Relevant log entries with timestamps",
-        "Timeline of events",
-    ])
+        return ()
+    if incident_defaults is None:
+        return _incident_tables().evidence_checklist
+    return incident_defaults.get("evidence_checklist", _DEFAULT_EVIDENCE_CHECKLIST)
 
 
-def compose_incident_update(input_data: IncidentInput) -> dict[str, str]:
+def compose_incident_update(
+    input_data: IncidentInput,
+    timestamp: str | None = None,
+    audiences: tuple[str, ...] = AUDIENCES,
+) -> dict[str, str]:
     """Compose incident update outputs for different audiences.
 
     Args:
         input_data: Validated incident input data
+        timestamp: Generated timestamp to embed (default: current time)
+        audiences: Audiences to render (subset of 'manager', 'client')
 
     Returns:
-        Dictionary with 'manager' and 'client' formatted updates
+        Dictionary of formatted updates keyed by audience
     """
-    defaults = load_defaults()
-
     # Merge input with defaults
-    input_dict = asdict(input_data)
-    incident_defaults = {
-        "audience": defaults["incident"]["audience"],
-        "severity": defaults["incident"]["severity"],
-        "current_status": defaults["incident"]["current_status"],
-    }
-    merged = merge_with_defaults(input_dict, incident_defaults)
+    # Shallow field copy: IncidentInput is flat and slotted (no __dict__), and
+    # asdict() would deep-copy the checks/evidence lists for nothing
+    merged = {f.name: getattr(input_data, f.name) for f in fields(input_data)}
+    for key, default in _incident_tables().field_defaults.items():
+        if not merged[key]:
+            merged[key] = default
 
     # Auto-fill next update time if not provided
     if not merged.get("next_update_time"):
-        merged["next_update_time"] = get_next_update_time(merged["severity"], defaults)
+        merged["next_update_time"] = get_next_update_time(merged["severity"])
 
     # Auto-generate next steps
-    next_steps = get_next_steps(merged["current_status"], defaults)
+    next_steps = get_next_steps(merged["current_status"])
 
     # Get evidence or checklist
-    has_evidence = bool(merged.get("evidence"))
-    evidence_checklist = get_evidence_checklist(has_evidence, defaults)
-
-    # Build context for template
+    checks_done = merged.get("checks_done", [])
+    evidence = merged.get("evidence", [])
+    has_checks = bool(checks_done)
+    has_evidence = bool(evidence)
+    evidence_checklist = get_evidence_checklist(has_evidence)
+
+    # Build context for template (lists are only formatted when non-empty).
+    # Markdown lists are joined inline here rather than through
+    # format_bullet_list/format_numbered_list to save calls on the hot path.
     context = {
         "incident_title": merged["incident_title"],
         "impact_summary": merged["impact_summary"],
         "severity": merged["severity"],
         "current_status": merged["current_status"],
         "next_update_time": merged["next_update_time"],
-        "checks_done": merged.get("checks_done", []),
-        "checks_done_formatted": format_bullet_list(merged.get("checks_done", [])),
-        "evidence": merged.get("evidence", []),
-        "evidence_formatted": format_bullet_list(merged.get("evidence", [])),
+        "checks_done": checks_done,
+        "checks_done_formatted": _join_lines([f"- {c}" for c in checks_done]) if has_checks else "",
+        "evidence": evidence,
+        "evidence_formatted": _join_lines([f"- {e}" for e in evidence]) if has_evidence else "",
         "evidence_checklist": evidence_checklist,
-        "evidence_checklist_formatted": format_bullet_list(evidence_checklist),
+        "evidence_checklist_formatted": (
+            _join_lines([f"- {e}" for e in evidence_checklist]) if evidence_checklist else ""
+        ),
         "next_steps": next_steps,
-        "next_steps_formatted": format_numbered_list(next_steps),
-        "timestamp": get_current_timestamp(),
+        "next_steps_formatted": _join_lines(
+            [f"{i}. {step}" for i, step in enumerate(next_steps, start=1)]
+        ),
+        "timestamp": timestamp or get_current_timestamp(),
         "has_evidence": has_evidence,
-        "has_checks": bool(merged.get("checks_done")),
+        "has_checks": has_checks,
     }
 
-    # Render templates for each audience
-    result = {}
-
-    # Manager update
-    result["manager"] = render_template("incident_update_manager.md", context)
-
-    # Client update
-    result["client"] = render_template("incident_update_client.md", context)
-
-    return result
+    if set(audiences) == set(AUDIENCES):
+        # Render both audiences in one pass, then split on the template's marker
+        rendered = render_template("incident_update_combined.md", context)
+        if rendered.count(_AUDIENCE_SPLIT) == 1:
+            manager, client = rendered.split(_AUDIENCE_SPLIT)
+            return {"manager": manager, "client": client}
+        # The marker also came from user input; render the audiences separately
+    return {
+        audience: render_template(f"incident_update_{audience}.md", context)
+        for audience in audiences
+    }
 
 
 def generate_incident_update(
@@ -145,6 +218,7 @@ def generate_incident_update(
     next_update_time: str | None = None,
     checks_done: list[str] | None = None,
     evidence: list[str] | None = None,
+    timestamp: str | None = None,
 ) -> str:
     """Generate an incident update from input parameters.
 
@@ -159,6 +233,7 @@ def generate_incident_update(
         next_update_time: When next update will be provided (auto-filled if None)
         checks_done: List of diagnostic checks completed
         evidence: List of evidence collected
+        timestamp: Generated timestamp to embed (default: current time)
 
     Returns:
         Formatted incident update string for the specified audience
@@ -178,26 +253,61 @@ def generate_incident_update(
     if errors:
         raise ValueError(f"Invalid input: {', '.join(errors)}")
 
-    updates = compose_incident_update(input_data)
-    return updates.get(audience, updates["manager"])
+    # Only render the requested audience; others fall back to the manager format
+    rendered_audience = audience if audience in AUDIENCES else "manager"
+    updates = compose_incident_update(
+        input_data, timestamp=timestamp, audiences=(rendered_audience,)
+    )
+    return updates[rendered_audience]
+
+
+# YAML input keys and their defaults, in generate_incident_update order
+_YAML_FIELDS = (
+    ("incident_title", ""),
+    ("impact_summary", ""),
+    ("audience", "manager"),
+    ("severity", "P2"),
+    ("current_status", "investigating"),
+    ("next_update_time", None),
+    ("checks_done", None),
+    ("evidence", None),
+)
 
 
-def generate_from_yaml(yaml_data: dict[str, Any]) -> str:
+def generate_from_yaml(yaml_data: dict[str, Any], timestamp: str | None = None) -> str:
     """Generate incident update from YAML input data.
 
     Args:
         yaml_data: Dictionary loaded from YAML file
+        timestamp: Generated timestamp to embed (default: current time)
 
     Returns:
         Formatted incident update string
     """
-    return generate_incident_update(
-        incident_title=yaml_data.get("incident_title", ""),
-        impact_summary=yaml_data.get("impact_summary", ""),
-        audience=yaml_data.get("audience", "manager"),
-        severity=yaml_data.get("severity", "P2"),
-        current_status=yaml_data.get("current_status", "investigating"),
-        next_update_time=yaml_data.get("next_update_time"),
-        checks_done=yaml_data.get("checks_done", []),
-        evidence=yaml_data.get("evidence", []),
-    )
+    kwargs = {name: yaml_data.get(name, default) for name, default in _YAML_FIELDS}
+    return generate_incident_update(**kwargs, timestamp=timestamp)
+
+
+def _warm_worker() -> None:
+    """Pre-load defaults and the incident template in a batch worker process."""
+    _incident_tables()
+    env = get_template_env()
+    for audience in AUDIENCES:
+        env.get_template(f"incident_update_{audience}.md")
+
+
+def generate_batch(
+    items: list[dict[str, Any]], max_workers: int | None = None
+) -> list[str]:
+    """Generate incident updates for many YAML inputs across worker processes.
+
+    Args:
+        items: List of dictionaries loaded from YAML files
+        max_workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Formatted incident updates in the same order as items
+    """
+    # One timestamp for the whole batch keeps the outputs consistent
+    generate = partial(generate_from_yaml, timestamp=get_current_timestamp())
+    return run_batch(generate, items, initializer=_warm_worker, max_workers=max_workers)
@@ -10,77 +10,138 @@ Key features:
 - NO disruptive actions allowed by default
 """
 
-from dataclasses import dataclass, field
+import os
+from collections.abc import Mapping
+from functools import lru_cache, partial
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-import yaml
+from jinja2 import Environment, Template
 
-from netops_skills.common.render import render_template
-from netops_skills.common.utils import get_current_timestamp, load_defaults
+from netops_skills.common.render import get_template_env
+# RunbookInput is defined in common.schema and re-exported here for callers
+from netops_skills.common.schema import (  # noqa: F401
+    ACCESS_MODES,
+    RunbookInput,
+    _VALID_ACCESS_MODES,
+)
+from netops_skills.common.utils import get_current_timestamp, load_config_file, run_batch
+
+
+_PLAYBOOKS_DIR = Path(__file__).resolve().parent.parent.parent / "playbooks"
 
 
 def get_playbooks_dir() -> Path:
     """Get the playbooks directory path."""
-    return Path(__file__).parent.parent.parent / "playbooks"
+    return _PLAYBOOKS_DIR
+
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
-def load_playbook(domain: str) -> dict[str, Any]:
+
+@lru_cache(maxsize=32)
+def load_playbook(domain: str) -> Mapping[str, Any]:
     """Load playbook for a specific domain.
 
+    Parsed playbooks are cached per process and shared between callers, so
+    the result is frozen all the way down (mappings are read-only views,
+    lists become tuples); playbook edits require a restart.
+
     Args:
         domain: Network domain (firewall, fmc, f5, etc.)
 
     Returns:
-        Playbook dictionary or empty dict if not found
+        Playbook mapping or empty mapping if not found
     """
     playbook_path = get_playbooks_dir() / f"{domain}.yaml"
     if not playbook_path.exists():
-        return {}
-    with open(playbook_path) as f:
-        return yaml.safe_load(f) or {}
+        return MappingProxyType({})
+    return _freeze(load_config_file(playbook_path) or {})
+
 
+@lru_cache(maxsize=None)
+def get_available_domains() -> tuple[str, ...]:
+    """Get available domains from playbook filenames, in sorted order.
 
-def get_available_domains() -> list[str]:
-    """Get list of available domains from playbooks."""
+    Only the directory listing is read; no playbook is parsed. Cached per
+    process; adding a playbook requires a restart to be picked up.
+    """
     playbooks_dir = get_playbooks_dir()
-    return [p.stem for p in playbooks_dir.glob("*.yaml")]
+    return tuple(sorted(p.stem for p in playbooks_dir.glob("*.yaml")))
 
 
-def get_symptoms_for_domain(domain: str) -> list[str]:
+@lru_cache(maxsize=None)
+def get_symptoms_for_domain(domain: str) -> tuple[str, ...]:
     """Get available symptoms for a domain.
 
+    Cached per process; playbook edits require a restart to be picked up.
+
     Args:
         domain: Network domain
 
     Returns:
-        List of symptom category names
+        Tuple of symptom category names
     """
     playbook = load_playbook(domain)
     symptoms = playbook.get("symptoms", {})
-    return list(symptoms.keys())
+    return tuple(symptoms.keys())
+
+
+def _preload_playbooks() -> None:
+    """Parse every playbook into the load_playbook cache.
+
+    A playbook that fails to load is skipped, so one malformed file does not
+    break the other domains; lru_cache does not cache the failure, so the
+    error is raised again when that domain is requested.
+    """
+    for domain in get_available_domains():
+        try:
+            load_playbook(domain)
+            get_symptoms_for_domain(domain)
+        except Exception:
+            continue
+
+
+# Parse all playbooks at import so generation only does dict lookups;
+# NETOPS_LAZY_PLAYBOOKS=1 defers each parse to the domain's first use
+if os.environ.get("NETOPS_LAZY_PLAYBOOKS") != "1":
+    _preload_playbooks()
 
 
-@dataclass
-class RunbookInput:
-    """Schema for runbook generator input."""
+# Environment labels for the runbook header; other values are upper-cased
+_ENV_DISPLAY = {"prod": "PROD", "uat": "UAT", "dev": "DEV", "lab": "LAB"}
 
-    # REQUIRED - must be selected (2 selections)
-    domain: str
-    symptom_category: str
 
-    # SELECTABLE with defaults
-    access_mode: str = "gui_only"
-    environment: str = "prod"
+@lru_cache(maxsize=None)
+def _display_title(text: str) -> str:
+    """Title-case text with the template's title filter, once per distinct value."""
+    return get_template_env().filters["title"](text)
 
-    def validate(self) -> list[str]:
-        """Validate required fields. Returns list of errors."""
-        errors = []
-        if not self.domain or not self.domain.strip():
-            errors.append("domain is required")
-        if not self.symptom_category or not self.symptom_category.strip():
-            errors.append("symptom_category is required")
-        return errors
+
+@lru_cache(maxsize=1)
+def _runbook_template(env: Environment) -> Template:
+    """Get the runbook template, resolved once per environment.
+
+    Keyed on the environment so a rebuilt one (e.g. after compile_templates)
+    is picked up instead of the template from the first environment.
+    """
+    return env.get_template("runbook.md")
+
+
+def _runbook_timestamp() -> str:
+    """Timestamp for generated runbooks.
+
+    NETOPS_RUNBOOK_TIMESTAMP, when set, is used verbatim so output can be
+    made fully reproducible; otherwise the current time is used.
+    """
+    return os.environ.get("NETOPS_RUNBOOK_TIMESTAMP") or get_current_timestamp()
 
 
 def filter_steps_by_access_mode(
@@ -106,6 +167,7 @@ def generate_runbook(
     symptom_category: str,
     access_mode: str = "gui_only",
     environment: str = "prod",
+    timestamp: str | None = None,
 ) -> str:
     """Generate a safe troubleshooting runbook.
 
@@ -114,18 +176,20 @@ def generate_runbook(
         symptom_category: Type of symptom (high_cpu, connectivity_loss, etc.)
         access_mode: Access level (gui_only, cli_read_only, cli_full)
         environment: Target environment (prod, uat, dev)
+        timestamp: Generated timestamp to embed (default:
+            NETOPS_RUNBOOK_TIMESTAMP, else current time)
 
     Returns:
         Formatted runbook string
     """
-    input_data = RunbookInput(
-        domain=domain,
-        symptom_category=symptom_category,
-        access_mode=access_mode,
-        environment=environment,
-    )
-
-    errors = input_data.validate()
+    # Inline precondition checks; RunbookInput.validate() remains for external callers
+    errors = []
+    if not domain or not domain.strip():
+        errors.append("domain is required")
+    if not symptom_category or not symptom_category.strip():
+        errors.append("symptom_category is required")
+    if access_mode not in _VALID_ACCESS_MODES:
+        errors.append(f"access_mode must be one of: {', '.join(ACCESS_MODES)}")
     if errors:
         raise ValueError(f"Invalid input: {', '.join(errors)}")
 
@@ -155,29 +219,84 @@ def generate_runbook(
         "symptom_category": symptom_category,
         "access_mode": access_mode,
         "environment": environment,
+        "domain_display": _display_title(domain),
+        "symptom_display": _display_title(symptom_category.replace("_", " ")),
+        # str() mirrors Jinja's filters, so a blank YAML value renders as None
+        "access_mode_display": _display_title(str(access_mode).replace("_", " ")),
+        "environment_display": _ENV_DISPLAY.get(environment) or str(environment).upper(),
         "symptom_explanation": symptom_data.get("explanation", ""),
         "diagnostic_steps": diagnostic_steps,
         "evidence_checklist": symptom_data.get("evidence_checklist", []),
         "stop_conditions": symptom_data.get("stop_conditions", []),
         "escalation_path": playbook.get("escalation_path", "Contact Tier 2 support"),
-        "timestamp": get_current_timestamp(),
+        "timestamp": timestamp or _runbook_timestamp(),
     }
 
-    return render_template("runbook.md", context)
+    return _runbook_template(get_template_env()).render(context)
+
+
+# YAML input keys and their defaults, in generate_runbook order
+_YAML_FIELDS = (
+    ("domain", ""),
+    ("symptom_category", ""),
+    ("access_mode", "gui_only"),
+    ("environment", "prod"),
+)
 
 
-def generate_from_yaml(yaml_data: dict[str, Any]) -> str:
+def generate_from_yaml(yaml_data: dict[str, Any], timestamp: str | None = None) -> str:
     """Generate runbook from YAML input data.
 
     Args:
         yaml_data: Dictionary loaded from YAML file
+        timestamp: Generated timestamp to embed (default:
+            NETOPS_RUNBOOK_TIMESTAMP, else current time)
 
     Returns:
         Formatted runbook string
     """
-    return generate_runbook(
-        domain=yaml_data.get("domain", ""),
-        symptom_category=yaml_data.get("symptom_category", ""),
-        access_mode=yaml_data.get("access_mode", "gui_only"),
-        environment=yaml_data.get("environment", "prod"),
-    )
+    kwargs = {name: yaml_data.get(name, default) for name, default in _YAML_FIELDS}
+    return generate_runbook(**kwargs, timestamp=timestamp)
+
+
+def generate_from_yaml_batch(
+    items: list[dict[str, Any]], timestamp: str | None = None
+) -> list[str]:
+    """Generate runbooks for many YAML inputs in this process.
+
+    The template, playbooks and timestamp are resolved once and shared by
+    every item.
+
+    Args:
+        items: List of dictionaries loaded from YAML files
+        timestamp: Generated timestamp to embed (default:
+            NETOPS_RUNBOOK_TIMESTAMP, else current time)
+
+    Returns:
+        Formatted runbooks in the same order as items
+    """
+    timestamp = timestamp or _runbook_timestamp()
+    return [generate_from_yaml(item, timestamp=timestamp) for item in items]
+
+
+def _warm_worker() -> None:
+    """Pre-load playbooks and the runbook template in a batch worker process."""
+    _preload_playbooks()
+    _runbook_template(get_template_env())
+
+
+def generate_batch(
+    items: list[dict[str, Any]], max_workers: int | None = None
+) -> list[str]:
+    """Generate runbooks for many YAML inputs across worker processes.
+
+    Args:
+        items: List of dictionaries loaded from YAML files
+        max_workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Formatted runbooks in the same order as items
+    """
+    # One timestamp for the whole batch keeps the outputs consistent
+    generate = partial(generate_from_yaml, timestamp=_runbook_timestamp())
+    return run_batch(generate, items, initializer=_warm_worker, max_workers=max_workers)
@@ -0,0 +1,39 @@
+"""Compile bundled YAML config (defaults, profiles, playbooks) to JSON.
+
+The loaders in netops_skills prefer a .json sibling stamped with its YAML
+source's mtime, which skips YAML parsing at runtime. They write it
+themselves when the install directory is writable; run this to pre-build
+it otherwise (stale JSON is ignored automatically).
+
+Usage:
+    python scripts/compile_configs.py
+"""
+
+from pathlib import Path
+
+from netops_skills.common.utils import get_config_dir, load_config_file
+from netops_skills.skills.runbook_generator import get_playbooks_dir
+
+
+def compile_configs() -> list[Path]:
+    """Write a .json copy of every bundled YAML config file.
+
+    Files whose contents JSON cannot represent faithfully are skipped.
+
+    Returns:
+        Paths of the JSON files written
+    """
+    written = []
+    for yaml_path in [*get_config_dir().glob("*.yaml"), *get_playbooks_dir().glob("*.yaml")]:
+        json_path = yaml_path.with_suffix(".json")
+        json_path.unlink(missing_ok=True)
+        # load_config_file parses the YAML and writes the JSON copy atomically
+        load_config_file(yaml_path)
+        if json_path.exists():
+            written.append(json_path)
+    return written
+
+
+if __name__ == "__main__":
+    for path in compile_configs():
+        print(f"Compiled: {path}")
@@ -0,0 +1,12 @@
+"""Compile Jinja2 templates ahead of time so the CLI skips parsing at runtime.
+
+Usage:
+    python scripts/compile_templates.py
+"""
+
+from netops_skills.common.render import compile_templates
+
+
+if __name__ == "__main__":
+    target = compile_templates()
+    print(f"Compiled templates written to: {target}")
@@ -0,0 +1,53 @@
+"""Shared pytest fixtures."""
+
+import re
+from dataclasses import replace
+
+import pytest
+
+from netops_skills.skills.runbook_generator import (
+    RunbookInput,
+    generate_runbook,
+    get_symptoms_for_domain,
+    load_playbook,
+)
+
+
+# "## Title" headings of a rendered runbook and the body up to the next one
+_SECTION_RE = re.compile(r"^## (?P<title>[^\n]+)\n(?P<body>.*?)(?=\n## |\Z)", re.S | re.M)
+
+
+def parse_sections(result: str) -> dict[str, str]:
+    """Split rendered markdown into {heading: body} in a single pass."""
+    return {m["title"]: m["body"] for m in _SECTION_RE.finditer(result)}
+
+
+@pytest.fixture(scope="session")
+def firewall_high_cpu_runbook():
+    """Default firewall/high_cpu runbook, rendered once per test session."""
+    return generate_runbook(domain="firewall", symptom_category="high_cpu")
+
+
+@pytest.fixture(scope="session")
+def firewall_high_cpu_sections(firewall_high_cpu_runbook):
+    """Sections of the default firewall/high_cpu runbook, keyed by heading."""
+    return parse_sections(firewall_high_cpu_runbook)
+
+
+@pytest.fixture(scope="session")
+def firewall_playbook():
+    """Parsed firewall playbook."""
+    return load_playbook("firewall")
+
+
+@pytest.fixture(scope="session")
+def firewall_symptoms():
+    """Symptom categories of the firewall playbook."""
+    return get_symptoms_for_domain("firewall")
+
+
+@pytest.fixture(scope="session")
+def make_runbook_input():
+    """Build RunbookInputs from a valid firewall/high_cpu prototype plus overrides."""
+    prototype = RunbookInput(domain="firewall", symptom_category="high_cpu")
+    return lambda **overrides: replace(prototype, **overrides)
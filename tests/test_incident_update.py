@@ -4,7 +4,9 @@ import pytest
 
 from netops_skills.common.schema import IncidentInput
 from netops_skills.skills.incident_update import (
+    _incident_tables,
     compose_incident_update,
+    generate_batch,
     generate_from_yaml,
     generate_incident_update,
     get_evidence_checklist,
@@ -69,22 +71,37 @@ class TestNextSteps:
 
     def test_investigating_status_has_next_steps(self):
         """Investigating status returns appropriate next steps."""
-        defaults = load_defaults()
-        steps = get_next_steps("investigating", defaults)
+        incident_defaults = load_defaults()["incident"]
+        steps = get_next_steps("investigating", incident_defaults=incident_defaults)
         assert len(steps) > 0
         assert any("root cause" in step.lower() for step in steps)
 
     def test_resolved_status_has_next_steps(self):
         """Resolved status returns appropriate next steps."""
-        defaults = load_defaults()
-        steps = get_next_steps("resolved", defaults)
+        incident_defaults = load_defaults()["incident"]
+        steps = get_next_steps("resolved", incident_defaults=incident_defaults)
         assert len(steps) > 0
         assert any("confirm" in step.lower() or "documentation" in step.lower() for step in steps)
 
+    def test_cached_tables_match_explicit_defaults(self):
+        """Omitting defaults uses the cached tables with the same result."""
+        incident_defaults = load_defaults()["incident"]
+        assert get_next_steps("identified") == get_next_steps(
+            "identified", incident_defaults=incident_defaults
+        )
+        assert get_evidence_checklist(False) == get_evidence_checklist(
+            False, incident_defaults=incident_defaults
+        )
+
+    def test_defaults_must_be_passed_by_keyword(self):
+        """Passing defaults positionally fails instead of silently falling back."""
+        with pytest.raises(TypeError):
+            get_next_steps("identified", load_defaults())
+
     def test_unknown_status_has_fallback(self):
         """Unknown status returns fallback next step."""
-        defaults = load_defaults()
-        steps = get_next_steps("unknown_status", defaults)
+        incident_defaults = load_defaults()["incident"]
+        steps = get_next_steps("unknown_status", incident_defaults=incident_defaults)
         assert len(steps) > 0
 
 
@@ -93,34 +110,50 @@ class TestNextUpdateTime:
 
     def test_p1_has_short_update_time(self):
         """P1 incidents have short update intervals."""
-        defaults = load_defaults()
-        time = get_next_update_time("P1", defaults)
+        incident_defaults = load_defaults()["incident"]
+        time = get_next_update_time("P1", incident_defaults=incident_defaults)
         assert "30" in time or "minute" in time.lower()
 
     def test_p4_has_longer_update_time(self):
         """P4 incidents have longer update intervals."""
-        defaults = load_defaults()
-        time = get_next_update_time("P4", defaults)
+        incident_defaults = load_defaults()["incident"]
+        time = get_next_update_time("P4", incident_defaults=incident_defaults)
         assert "day" in time.lower() or "business" in time.lower()
 
 
+class TestDefaultsCaching:
+    """Tests for per-process caching of defaults.yaml."""
+
+    def test_defaults_parsed_once_across_updates(self):
+        """Repeated updates reuse the same parsed defaults."""
+        load_defaults.cache_clear()
+        _incident_tables.cache_clear()
+        generate_incident_update(incident_title="Test", impact_summary="Impact")
+        generate_incident_update(incident_title="Test", impact_summary="Impact")
+        assert load_defaults.cache_info().misses == 1
+
+
 class TestEvidenceChecklist:
     """Tests for evidence checklist generation."""
 
     def test_no_evidence_returns_checklist(self):
         """When no evidence provided, checklist is returned."""
         from netops_skills.common.utils import load_defaults
-        defaults = load_defaults()
-        checklist = get_evidence_checklist(has_evidence=False, defaults=defaults)
+        incident_defaults = load_defaults()["incident"]
+        checklist = get_evidence_checklist(
+            has_evidence=False, incident_defaults=incident_defaults
+        )
         assert len(checklist) > 0
         assert any("screenshot" in item.lower() for item in checklist)
 
     def test_has_evidence_returns_empty_checklist(self):
         """When evidence provided, no checklist returned."""
         from netops_skills.common.utils import load_defaults
-        defaults = load_defaults()
-        checklist = get_evidence_checklist(has_evidence=True, defaults=defaults)
-        assert checklist == []
+        incident_defaults = load_defaults()["incident"]
+        checklist = get_evidence_checklist(
+            has_evidence=True, incident_defaults=incident_defaults
+        )
+        assert checklist == ()
 
 
 class TestComposeIncidentUpdate:
@@ -201,6 +234,33 @@ class TestComposeIncidentUpdate:
         assert "Diagnostic Checks Completed" in manager_output
         assert "Verified connectivity" in manager_output
 
+    def test_renders_only_requested_audiences(self):
+        """Only the requested audiences are rendered."""
+        input_data = IncidentInput(
+            incident_title="Test incident",
+            impact_summary="Test impact",
+        )
+        outputs = compose_incident_update(input_data, audiences=("client",))
+
+        assert list(outputs) == ["client"]
+        assert "Dear Valued Customer" in outputs["client"]
+
+    def test_split_marker_in_input_does_not_truncate(self):
+        """User text containing the combined-template marker is kept intact."""
+        input_data = IncidentInput(
+            incident_title="Edge <!--SPLIT--> case",
+            impact_summary="Test impact",
+        )
+        ts = "2024-01-01 00:00 UTC"
+        outputs = compose_incident_update(input_data, timestamp=ts)
+
+        for audience in ("manager", "client"):
+            separate = compose_incident_update(
+                input_data, timestamp=ts, audiences=(audience,)
+            )
+            assert outputs[audience] == separate[audience]
+            assert "Edge <!--SPLIT--> case" in outputs[audience]
+
 
 class TestGenerateIncidentUpdate:
     """Tests for main entry point function."""
@@ -276,6 +336,17 @@ class TestGenerateFromYaml:
         assert "P1" in result
         assert "Dear Valued Customer" in result
 
+    def test_batch_preserves_input_order(self):
+        """Batch generation returns one output per item, in order."""
+        items = [
+            {"incident_title": "VPN down", "impact_summary": "Users cannot connect"},
+            {"incident_title": "DNS slow", "impact_summary": "Lookups timing out"},
+        ]
+        results = generate_batch(items)
+        assert len(results) == 2
+        assert "VPN down" in results[0]
+        assert "DNS slow" in results[1]
+
     def test_yaml_defaults_applied(self):
         """Missing YAML fields use defaults."""
         yaml_data = {
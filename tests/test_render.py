@@ -0,0 +1,63 @@
+"""Tests for template rendering helpers."""
+
+import os
+
+import pytest
+from jinja2 import FileSystemLoader, ModuleLoader
+
+from netops_skills.common import render
+from netops_skills.common.render import (
+    _compiled_templates_current,
+    compile_templates,
+    get_template_env,
+    render_template,
+)
+
+
+@pytest.fixture
+def template_dirs(tmp_path, monkeypatch):
+    """Point the renderer at throwaway template and compiled directories."""
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "hello.md").write_text("Hello {{ name }}")
+    compiled = tmp_path / "compiled"
+    monkeypatch.setattr(render, "_TEMPLATES_DIR", templates)
+    monkeypatch.setattr(render, "_COMPILED_TEMPLATES_DIR", compiled)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    get_template_env.cache_clear()
+    yield templates, compiled
+    get_template_env.cache_clear()
+
+
+class TestCompiledTemplates:
+    """Tests for choosing between compiled and source templates."""
+
+    def test_uses_compiled_templates_when_current(self, template_dirs):
+        """Up-to-date compiled templates are loaded through ModuleLoader."""
+        compile_templates()
+        env = get_template_env()
+        assert isinstance(env.loader, ModuleLoader)
+        assert render_template("hello.md", {"name": "NOC"}) == "Hello NOC"
+
+    def test_falls_back_to_source_without_compiled(self, template_dirs):
+        """Without compiled templates, sources are parsed directly."""
+        assert isinstance(get_template_env().loader, FileSystemLoader)
+        assert render_template("hello.md", {"name": "NOC"}) == "Hello NOC"
+
+    def test_renamed_template_is_not_current(self, template_dirs):
+        """A template without its own compiled module forces the fallback."""
+        templates, _ = template_dirs
+        compile_templates()
+        # rename keeps the mtime, so only the per-name check catches it
+        os.rename(templates / "hello.md", templates / "hello_v2.md")
+        assert not _compiled_templates_current()
+        assert isinstance(get_template_env().loader, FileSystemLoader)
+
+    def test_edited_template_is_not_current(self, template_dirs):
+        """A source newer than its compiled module forces the fallback."""
+        templates, compiled = template_dirs
+        compile_templates()
+        module = compiled / ModuleLoader.get_module_filename("hello.md")
+        newer = module.stat().st_mtime_ns + 10**9
+        os.utime(templates / "hello.md", ns=(newer, newer))
+        assert not _compiled_templates_current()
@@ -1,10 +1,18 @@
 """Tests for Runbook Generator skill."""
 
 import pytest
+import yaml
 
+from netops_skills.common import schema
+from netops_skills.common.render import get_template_env
+from netops_skills.skills import runbook_generator
 from netops_skills.skills.runbook_generator import (
     RunbookInput,
+    _preload_playbooks,
+    _runbook_template,
+    generate_batch,
     generate_from_yaml,
+    generate_from_yaml_batch,
     generate_runbook,
     get_available_domains,
     get_symptoms_for_domain,
@@ -15,33 +23,29 @@ from netops_skills.skills.runbook_generator import (
 class TestRunbookInput:
     """Tests for RunbookInput schema validation."""
 
-    def test_valid_input_passes_validation(self):
+    def test_valid_input_passes_validation(self, make_runbook_input):
         """Valid input with required fields passes validation."""
-        input_data = RunbookInput(
-            domain="firewall",
-            symptom_category="high_cpu",
-        )
-        errors = input_data.validate()
+        errors = make_runbook_input().validate()
         assert errors == []
 
-    def test_missing_domain_fails_validation(self):
+    def test_missing_domain_fails_validation(self, make_runbook_input):
         """Missing domain fails validation."""
-        input_data = RunbookInput(
-            domain="",
-            symptom_category="high_cpu",
-        )
-        errors = input_data.validate()
+        errors = make_runbook_input(domain="").validate()
         assert "domain is required" in errors
 
-    def test_missing_symptom_fails_validation(self):
+    def test_missing_symptom_fails_validation(self, make_runbook_input):
         """Missing symptom_category fails validation."""
-        input_data = RunbookInput(
-            domain="firewall",
-            symptom_category="",
-        )
-        errors = input_data.validate()
+        errors = make_runbook_input(symptom_category="").validate()
         assert "symptom_category is required" in errors
 
+    def test_blank_fields_fail_validation_in_order(self, make_runbook_input):
+        """Whitespace-only fields fail, reported in field order."""
+        input_data = make_runbook_input(domain="  ", symptom_category="")
+        assert input_data.validate() == [
+            "domain is required",
+            "symptom_category is required",
+        ]
+
     def test_defaults_are_applied(self):
         """Default values are set correctly."""
         input_data = RunbookInput(
@@ -51,6 +55,27 @@ class TestRunbookInput:
         assert input_data.access_mode == "gui_only"
         assert input_data.environment == "prod"
 
+    def test_unknown_access_mode_fails_validation(self, make_runbook_input):
+        """Access modes outside the supported set fail validation."""
+        input_data = make_runbook_input(access_mode="cli_write")
+        assert input_data.validate() == [
+            "access_mode must be one of: gui_only, cli_read_only, cli_full"
+        ]
+
+    def test_single_schema_class(self):
+        """The generator and common.schema share one RunbookInput."""
+        assert RunbookInput is schema.RunbookInput
+
+    def test_instances_are_slotted(self, make_runbook_input):
+        """Instances carry no per-instance __dict__."""
+        assert not hasattr(make_runbook_input(), "__dict__")
+        assert set(RunbookInput.__slots__) == {
+            "domain",
+            "symptom_category",
+            "access_mode",
+            "environment",
+        }
+
 
 class TestPlaybookLoading:
     """Tests for playbook loading functions."""
@@ -60,10 +85,11 @@ class TestPlaybookLoading:
         domains = get_available_domains()
         assert len(domains) > 0
         assert "firewall" in domains
+        assert list(domains) == sorted(domains)
 
-    def test_load_existing_playbook(self):
+    def test_load_existing_playbook(self, firewall_playbook):
         """Existing playbook loads successfully."""
-        playbook = load_playbook("firewall")
+        playbook = firewall_playbook
         assert playbook is not None
         assert "symptoms" in playbook
 
@@ -72,56 +98,90 @@ class TestPlaybookLoading:
         playbook = load_playbook("nonexistent_domain")
         assert playbook == {}
 
-    def test_get_symptoms_for_domain(self):
+    def test_playbook_parsed_once(self):
+        """Repeated loads of a domain reuse the cached playbook."""
+        load_playbook.cache_clear()
+        first = load_playbook("firewall")
+        assert load_playbook("firewall") is first
+        assert load_playbook.cache_info().misses == 1
+
+    def test_cached_playbook_is_read_only(self):
+        """The shared cached playbook cannot be mutated by callers."""
+        playbook = load_playbook("firewall")
+        with pytest.raises(TypeError):
+            playbook["symptoms"] = {}
+        high_cpu = playbook["symptoms"]["high_cpu"]
+        with pytest.raises(TypeError):
+            high_cpu["explanation"] = ""
+        with pytest.raises(AttributeError):
+            high_cpu["stop_conditions"].append("Injected")
+
+    def test_preload_fills_playbook_cache(self):
+        """Preloading parses every available playbook up front."""
+        load_playbook.cache_clear()
+        _preload_playbooks()
+        assert load_playbook.cache_info().currsize == len(get_available_domains())
+
+    def test_preload_skips_malformed_playbook(self, tmp_path, monkeypatch):
+        """A malformed playbook only fails when its own domain is requested."""
+        (tmp_path / "good.yaml").write_text("symptoms:\n  high_cpu:\n    explanation: CPU\n")
+        (tmp_path / "zz_broken.yaml").write_text("symptoms: [unclosed\n")
+        monkeypatch.setattr(runbook_generator, "_PLAYBOOKS_DIR", tmp_path)
+        caches = (load_playbook, get_available_domains, get_symptoms_for_domain)
+        for cached in caches:
+            cached.cache_clear()
+        try:
+            _preload_playbooks()
+            assert get_symptoms_for_domain("good") == ("high_cpu",)
+            with pytest.raises(yaml.YAMLError):
+                load_playbook("zz_broken")
+        finally:
+            for cached in caches:
+                cached.cache_clear()
+
+    def test_get_symptoms_for_domain(self, firewall_symptoms):
         """Symptoms are retrieved for a domain."""
-        symptoms = get_symptoms_for_domain("firewall")
+        symptoms = firewall_symptoms
         assert len(symptoms) > 0
         assert "high_cpu" in symptoms
 
+    def test_directory_scans_cached(self):
+        """Domain and symptom lookups are computed once and reused."""
+        assert get_available_domains() is get_available_domains()
+        symptoms = get_symptoms_for_domain("firewall")
+        assert isinstance(symptoms, tuple)
+        assert get_symptoms_for_domain("firewall") is symptoms
+
 
 class TestGenerateRunbook:
     """Tests for runbook generation."""
 
-    def test_generates_runbook_for_valid_input(self):
+    def test_generates_runbook_for_valid_input(self, firewall_high_cpu_runbook):
         """Valid input generates a runbook."""
-        result = generate_runbook(
-            domain="firewall",
-            symptom_category="high_cpu",
-        )
+        result = firewall_high_cpu_runbook
         assert "Troubleshooting Runbook" in result
         assert "Firewall" in result
         assert "High Cpu" in result
 
-    def test_runbook_contains_required_sections(self):
+    def test_runbook_contains_required_sections(self, firewall_high_cpu_sections):
         """Runbook contains all required sections."""
-        result = generate_runbook(
-            domain="firewall",
-            symptom_category="high_cpu",
-        )
-        # Check required sections
-        assert "What This Symptom Usually Indicates" in result
-        assert "Safe Diagnostic Steps" in result
-        assert "Evidence Checklist" in result
-        assert "STOP - Escalate Immediately If" in result
-        assert "Escalation Path" in result
-
-    def test_runbook_contains_stop_conditions(self):
+        assert {
+            "What This Symptom Usually Indicates",
+            "Safe Diagnostic Steps",
+            "Evidence Checklist",
+            "STOP - Escalate Immediately If:",
+            "Escalation Path",
+        } <= firewall_high_cpu_sections.keys()
+
+    def test_runbook_contains_stop_conditions(self, firewall_high_cpu_runbook):
         """Runbook includes STOP conditions."""
-        result = generate_runbook(
-            domain="firewall",
-            symptom_category="high_cpu",
-        )
+        result = firewall_high_cpu_runbook
         assert "STOP" in result
         assert "Escalate" in result
 
-    def test_runbook_contains_evidence_checklist(self):
+    def test_runbook_contains_evidence_checklist(self, firewall_high_cpu_sections):
         """Runbook includes evidence checklist."""
-        result = generate_runbook(
-            domain="firewall",
-            symptom_category="high_cpu",
-        )
-        assert "Evidence Checklist" in result
-        assert "[ ]" in result  # Checkbox format
+        assert "[ ]" in firewall_high_cpu_sections["Evidence Checklist"]  # Checkbox format
 
     def test_raises_error_for_invalid_domain(self):
         """Invalid domain raises ValueError."""
@@ -141,6 +201,16 @@ class TestGenerateRunbook:
             )
         assert "Unknown symptom" in str(exc_info.value)
 
+    def test_raises_error_for_unknown_access_mode(self):
+        """Access modes outside the supported set raise ValueError."""
+        with pytest.raises(ValueError) as exc_info:
+            generate_runbook(
+                domain="firewall",
+                symptom_category="high_cpu",
+                access_mode="cli_write",
+            )
+        assert "access_mode must be one of" in str(exc_info.value)
+
     def test_raises_error_for_empty_input(self):
         """Empty input raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
@@ -150,26 +220,19 @@ class TestGenerateRunbook:
             )
         assert "domain is required" in str(exc_info.value)
 
-    def test_access_mode_appears_in_output(self):
+    def test_access_mode_appears_in_output(self, firewall_high_cpu_runbook):
         """Access mode is shown in output."""
-        result = generate_runbook(
-            domain="firewall",
-            symptom_category="high_cpu",
-            access_mode="gui_only",
-        )
-        assert "Gui Only" in result or "gui_only" in result.lower()
+        # Rendered with the default access_mode, gui_only
+        assert "Gui Only" in firewall_high_cpu_runbook
 
-    def test_environment_appears_in_output(self):
+    def test_environment_appears_in_output(self, firewall_high_cpu_runbook):
         """Environment is shown in output."""
-        result = generate_runbook(
-            domain="firewall",
-            symptom_category="high_cpu",
-            environment="prod",
-        )
-        assert "PROD" in result
+        # Rendered with the default environment, prod
+        assert "PROD" in firewall_high_cpu_runbook
 
-    def test_deterministic_output(self):
-        """Same input produces same output (excluding timestamp)."""
+    def test_deterministic_output(self, monkeypatch):
+        """Same input produces identical output with a pinned timestamp."""
+        monkeypatch.setenv("NETOPS_RUNBOOK_TIMESTAMP", "2024-01-01 00:00 UTC")
         result1 = generate_runbook(
             domain="firewall",
             symptom_category="high_cpu",
@@ -178,10 +241,24 @@ class TestGenerateRunbook:
             domain="firewall",
             symptom_category="high_cpu",
         )
-        # Remove timestamp line for comparison
-        result1_lines = [l for l in result1.split("\n") if "Generated:" not in l]
-        result2_lines = [l for l in result2.split("\n") if "Generated:" not in l]
-        assert result1_lines == result2_lines
+        assert result1 == result2
+        assert "Generated: 2024-01-01 00:00 UTC" in result1
+
+    def test_template_follows_rebuilt_environment(self):
+        """A rebuilt template environment is used for later runbooks."""
+        generate_runbook(domain="firewall", symptom_category="high_cpu")
+        get_template_env.cache_clear()
+        env = get_template_env()
+        assert _runbook_template(env).environment is env
+
+    def test_timestamp_override(self):
+        """A supplied timestamp is used instead of the current time."""
+        result = generate_runbook(
+            domain="firewall",
+            symptom_category="high_cpu",
+            timestamp="2024-01-01 00:00 UTC",
+        )
+        assert "Generated: 2024-01-01 00:00 UTC" in result
 
 
 class TestGenerateFromYaml:
@@ -208,6 +285,39 @@ class TestGenerateFromYaml:
         result = generate_from_yaml(yaml_data)
         assert "UAT" in result
 
+    def test_batch_preserves_input_order(self):
+        """Batch generation returns one runbook per item, in order."""
+        items = [
+            {"domain": "firewall", "symptom_category": "high_cpu"},
+            {"domain": "f5", "symptom_category": "certificate_error"},
+        ]
+        results = generate_batch(items)
+        assert len(results) == 2
+        assert "Firewall" in results[0]
+        assert "F5" in results[1]
+
+    def test_yaml_batch_shares_timestamp(self):
+        """In-process batch renders every item with one timestamp."""
+        items = [
+            {"domain": "firewall", "symptom_category": "high_cpu"},
+            {"domain": "f5", "symptom_category": "certificate_error", "environment": "uat"},
+        ]
+        results = generate_from_yaml_batch(items, timestamp="2024-01-01 00:00 UTC")
+        assert len(results) == 2
+        assert "Firewall" in results[0]
+        assert "UAT" in results[1]
+        assert all("Generated: 2024-01-01 00:00 UTC" in r for r in results)
+
+    def test_yaml_blank_optional_fields_render(self):
+        """A blank optional YAML field (None) renders instead of crashing."""
+        yaml_data = {
+            "domain": "firewall",
+            "symptom_category": "high_cpu",
+            "environment": None,
+        }
+        result = generate_from_yaml(yaml_data)
+        assert "| Environment | NONE |" in result
+
     def test_yaml_defaults_applied(self):
         """Missing YAML fields use defaults."""
         yaml_data = {
@@ -222,40 +332,21 @@ class TestGenerateFromYaml:
 class TestSafetyRequirements:
     """Tests to ensure runbooks meet safety requirements."""
 
-    def test_no_disruptive_commands_by_default(self):
+    def test_no_disruptive_commands_by_default(self, firewall_high_cpu_runbook):
         """Default access mode does not include disruptive commands."""
-        result = generate_runbook(
-            domain="firewall",
-            symptom_category="high_cpu",
-            access_mode="gui_only",
-        )
+        # Rendered with the default access_mode, gui_only
         # Check footer confirms no disruptive commands
-        assert "No disruptive commands" in result
+        assert "No disruptive commands" in firewall_high_cpu_runbook
 
-    def test_stop_conditions_never_empty(self):
+    def test_stop_conditions_never_empty(self, firewall_high_cpu_sections):
         """STOP conditions section is never empty."""
-        result = generate_runbook(
-            domain="firewall",
-            symptom_category="high_cpu",
-        )
-        # Check that there are actual stop conditions
-        assert "STOP" in result
-        # There should be bullet points after STOP section
-        stop_index = result.find("STOP")
-        escalation_index = result.find("## Escalation Path")
-        stop_section = result[stop_index:escalation_index]
+        stop_section = firewall_high_cpu_sections["STOP - Escalate Immediately If:"]
         assert "-" in stop_section  # Has bullet points
 
-    def test_escalation_path_provided(self):
+    def test_escalation_path_provided(self, firewall_high_cpu_sections):
         """Escalation path is always provided."""
-        result = generate_runbook(
-            domain="firewall",
-            symptom_category="high_cpu",
-        )
-        assert "Escalation Path" in result
         # Check there's content after escalation path
-        escalation_index = result.find("## Escalation Path")
-        assert escalation_index > 0
+        assert firewall_high_cpu_sections["Escalation Path"].strip()
 
 
 class TestMultipleDomains:
@@ -0,0 +1,58 @@
+"""Tests for shared utilities."""
+
+import math
+import os
+
+from netops_skills.common.utils import load_config_file
+
+
+class TestLoadConfigFile:
+    """Tests for the JSON cache behind load_config_file."""
+
+    def test_parsed_yaml_cached_as_json(self, tmp_path):
+        """Parsing a YAML file leaves a JSON copy that later loads reuse."""
+        yaml_path = tmp_path / "lab.yaml"
+        yaml_path.write_text("symptoms:\n  high_cpu:\n    explanation: CPU\n")
+        parsed = load_config_file(yaml_path)
+        json_path = tmp_path / "lab.json"
+        assert json_path.exists()
+        assert load_config_file(yaml_path) == parsed
+
+    def test_json_cache_skipped_when_not_round_trippable(self, tmp_path):
+        """Data JSON would alter (non-string keys) is never cached."""
+        yaml_path = tmp_path / "lab.yaml"
+        yaml_path.write_text("codes:\n  404: not found\n  true: yes\n")
+        parsed = load_config_file(yaml_path)
+        assert parsed == {"codes": {404: "not found", True: True}}
+        assert not (tmp_path / "lab.json").exists()
+        assert load_config_file(yaml_path) == parsed
+
+    def test_json_cache_ignored_for_restored_older_yaml(self, tmp_path):
+        """A YAML restored with an older mtime invalidates the JSON copy."""
+        yaml_path = tmp_path / "lab.yaml"
+        yaml_path.write_text("name: new\n")
+        load_config_file(yaml_path)
+        yaml_path.write_text("name: old\n")
+        old_mtime_ns = (tmp_path / "lab.json").stat().st_mtime_ns - 10**9
+        os.utime(yaml_path, ns=(old_mtime_ns, old_mtime_ns))
+        assert load_config_file(yaml_path) == {"name": "old"}
+
+    def test_json_cache_skipped_for_nan(self, tmp_path):
+        """Non-finite floats are not cached, since they are not valid JSON."""
+        yaml_path = tmp_path / "lab.yaml"
+        yaml_path.write_text("val: .nan\n")
+        load_config_file(yaml_path)
+        assert not (tmp_path / "lab.json").exists()
+        assert math.isnan(load_config_file(yaml_path)["val"])
+
+    def test_corrupt_json_cache_falls_back_to_yaml(self, tmp_path):
+        """An undecodable JSON copy is treated as a miss and rebuilt."""
+        yaml_path = tmp_path / "lab.yaml"
+        yaml_path.write_text("name: lab\n")
+        load_config_file(yaml_path)
+        json_path = tmp_path / "lab.json"
+        json_path.write_text('{"name": "la')
+        yaml_mtime_ns = yaml_path.stat().st_mtime_ns
+        os.utime(json_path, ns=(yaml_mtime_ns, yaml_mtime_ns))
+        assert load_config_file(yaml_path) == {"name": "lab"}
+        assert json_path.read_text() == '{"name": "lab"}'